@@ -0,0 +1,39 @@
+from skyscanner.types import CabinClass
+from skyscanner import AsyncSkyScanner
+import asyncio
+import datetime
+import orjson
+
+
+async def main():
+    async with AsyncSkyScanner() as scanner:
+        JFK, MXP = await asyncio.gather(
+            scanner.get_airport_by_code('ist'),
+            scanner.get_airport_by_code('tyoa'),
+        )
+
+        prices = await scanner.get_flight_prices(
+            origin=JFK,
+            destination=MXP,
+            depart_date=datetime.datetime(2026, 6, 1, 10, 0),
+            return_date=datetime.datetime(2026, 6, 11, 10, 0),
+            adults=5,
+            childAges=[9,13],
+            cabinClass=CabinClass.FIRST
+        )
+        with open('prices.json','wb') as f:
+            f.write(orjson.dumps(prices.json, option=orjson.OPT_INDENT_2))
+
+        buckets = prices.json['itineraries']['buckets']
+
+        best_bucket = next((bucket for bucket in buckets if bucket['id'].lower() == 'best'), None)
+
+        # fetch details for the top itineraries concurrently
+        itinerary_details = await asyncio.gather(
+            *(scanner.get_itinerary_details(item['id'], prices) for item in best_bucket['items'][:3])
+        )
+        with open('details.json','wb') as f:
+            f.write(orjson.dumps(itinerary_details, option=orjson.OPT_INDENT_2))
+
+
+asyncio.run(main())
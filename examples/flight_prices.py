@@ -1,12 +1,13 @@
 from skyscanner.types import CabinClass
 from skyscanner import SkyScanner
 import datetime
-import json
+import orjson
 
 scanner = SkyScanner()
 
-JFK = scanner.get_airport_by_code('ist')
-MXP = scanner.get_airport_by_code('tyoa')
+airports = scanner.get_airports_by_codes(['ist', 'tyoa'])
+JFK = airports['ist']
+MXP = airports['tyoa']
 
 prices = scanner.get_flight_prices(
     origin=JFK,
@@ -17,8 +18,8 @@ prices = scanner.get_flight_prices(
     childAges=[9,13],
     cabinClass=CabinClass.FIRST
 )
-with open('prices.json','w') as f:
-    json.dump(prices.json,f,indent=4)
+with open('prices.json','wb') as f:
+    f.write(orjson.dumps(prices.json, option=orjson.OPT_INDENT_2))
     
 buckets = prices.json['itineraries']['buckets']
 
@@ -27,5 +28,5 @@ best_bucket = next((bucket for bucket in buckets if bucket['id'].lower() == 'bes
 best_itinerary_id = best_bucket['items'][0]['id']
 
 itinerary_details = scanner.get_itinerary_details(best_itinerary_id, prices)
-with open('details.json','w') as f:
-    json.dump(itinerary_details,f,indent=4)
+with open('details.json','wb') as f:
+    f.write(orjson.dumps(itinerary_details, option=orjson.OPT_INDENT_2))
@@ -1,5 +1,4 @@
 # __init__.py
-from .skyscanner import SkyScanner
-
-__all__ = ['SkyScanner']
+from .skyscanner import SkyScanner, AsyncSkyScanner
 
+__all__ = ['SkyScanner', 'AsyncSkyScanner']
@@ -1,9 +1,12 @@
+import asyncio
 import curl_cffi
+import concurrent.futures
 import datetime
+import os
+import threading
 import time
 import uuid
 import orjson
-from typeguard import typechecked
 from . import config
 from .px import PXSolver
 from .types import (
@@ -16,16 +19,57 @@ from .types import (
 )
 from .errors import AttemptsExhaustedIncompleteResponse, BannedWithCaptcha, GenericError
 
-# TODO aggiungere scraping da qualsiasi (tipo Milano)
-class SkyScanner:
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# runtime type checking is costly on every call, only enable it when debugging
+if os.getenv("SKYSCANNER_TYPECHECK") == "1":
+    from typeguard import typechecked
+else:
+    def typechecked(func):
+        return func
+
+_SPECIAL = frozenset({SpecialTypes.ANYTIME, SpecialTypes.EVERYWHERE})
+
+# constant parts of the itinerary details payload, shared between requests (orjson encodes tuples as arrays)
+_ITIN_FEATURES = ("FEATURES_ENABLED_ITINERARY_LEGACY_INFO",)
+_ITIN_FARE_ATTRS = ("ATTRIBUTE_CABIN_BAGGAGE", "ATTRIBUTE_CHECKED_BAGGAGE")
+# every payload references this same dict, it must never be mutated
+# (orjson can't serialize a MappingProxyType, so it stays a plain dict)
+_ITIN_OPTIONS = {"totalCostOptions": {"fareAttributeFilters": _ITIN_FARE_ATTRS}}
+
+
+class _BaseSkyScanner:
     """
-    A client for interacting with the Skyscanner flight and car rental APIs.
+    Shared state, request building and response parsing for the sync and async clients.
 
-    This class handles search session creation, flight price lookups, airport and location
-    autosuggestions, itinerary detail retrieval, and car rental listings, with built-in retry
-    and error handling.
+    Subclasses only perform the HTTP calls and the polling waits, everything that doesn't
+    touch the network lives here so both clients behave the same.
     """
 
+    _session_class = curl_cffi.Session
+    # PX authorizations (token, uuid) keyed by (proxy, verify), shared by every client in the process
+    _px_cache: dict[tuple[str, bool], tuple[str, str]] = {}
+
+    # static per-request headers, only the view / session ids change between calls
+    _flight_headers_base = {
+        "Content-Type": "application/json; charset=UTF-8",
+        "Accept-Encoding": "gzip, deflate, br",
+    }
+    _itinerary_headers_base = {
+        "grpc-metadata-x-skyscanner-devicedetection-istablet": "false",  # required
+        "grpc-metadata-x-skyscanner-devicedetection-ismobile": "true",  # required
+        "grpc-metadata-x-skyscanner-channelid": "goandroid",
+        "grpc-metadata-x-skyscanner-clientid": "skyscanner_app",
+        "grpc-metadata-x-skyscanner-client-type": "net.skyscanner.android.main",
+        "grpc-metadata-x-skyscanner-consent-information": "true",
+        "grpc-metadata-x-skyscanner-consent-adverts": "true",
+        "content-type": "application/json; charset=utf-8",
+        "accept-encoding": "gzip",
+    }
+
     @typechecked
     def __init__(
         self,
@@ -45,18 +89,27 @@ class SkyScanner:
             locale (str): Locale code for results (default: "en-US").
             currency (str): Currency code for pricing (default: "USD").
             market (str): Market region code (default: "US").
-            retry_delay (int): Seconds to wait between polling retries (default: 2).
-            max_retries (int): Maximum number of polling retries (default: 15).
+            retry_delay (int): Maximum seconds to wait between polling retries, polling backs off
+                exponentially up to this value. Car rental results must also stay unchanged for
+                this long (default: 2).
+            max_retries (int): Polling gives up after max_retries * retry_delay seconds of waiting (default: 15).
             proxies (dict): Proxy configuration for HTTP requests.
-            px_authorization (str | None): Optional pre-generated PX authorization token.
+            px_authorization (str | None): Optional pre-generated PX authorization token. When omitted
+                a token is generated once per proxy and reused by later clients until it gets banned.
             verify (bool): If set to False requests is not gonna verify the ssl certificate (default: True).
 
         Raises:
             None
         """
+        self._px_key = None
+        self._px_entry = None
         if not px_authorization:
-            solver = PXSolver(proxy=proxy, verify=verify)
-            px_authorization, UUID = solver.gen_px_authorization()
+            self._px_key = (proxy, verify)
+            if self._px_key not in self._px_cache:
+                solver = PXSolver(proxy=proxy, verify=verify)
+                self._px_cache[self._px_key] = solver.gen_px_authorization()
+            self._px_entry = self._px_cache[self._px_key]
+            px_authorization, UUID = self._px_entry
 
         headers = {
             "X-Skyscanner-ChannelId": "goandroid",
@@ -78,67 +131,234 @@ class SkyScanner:
         self.currency = currency
         self.locale = locale
         self.max_retries = max_retries
-        self.session = curl_cffi.Session(
+        self._airport_cache: dict[str, Airport] = {}
+        # pysimdjson parsers hold one live document at a time, keep one per thread
+        self._json_parsers = threading.local()
+        self.session = self._session_class(
             headers=headers,
             ja3=config.JA3,
             extra_fp=config.EXTRA_FP,
             akamai=config.AKAMAI,
             proxy=proxy,
             verify=verify,
+            http_version=curl_cffi.CurlHttpVersion.V2_0,
         )
 
     def _handle_captcha_403(self, req):
+        # a banned authorization must not be handed to new clients, unless another
+        # client already replaced it with a fresh one
+        if self._px_key is not None and self._px_cache.get(self._px_key) == self._px_entry:
+            self._px_cache.pop(self._px_key, None)
+
+        url = "https://www.skyscanner.net"
         try:
-            data = req.json()
-            redirect_path = data.get("redirect_to")
+            redirect_path = orjson.loads(req.content).get("redirect_to")
+        except Exception:
+            redirect_path = None
 
-            url = "https://www.skyscanner.net"
-            if redirect_path:
-                url += redirect_path
+        if redirect_path:
+            url += redirect_path
 
-            raise BannedWithCaptcha(url)
-        except Exception:
-            raise BannedWithCaptcha("https://www.skyscanner.net")
+        raise BannedWithCaptcha(url)
 
-    @typechecked
-    def get_flight_prices(
+    def _poll_delays(self):
+        """
+        Yield the wait before each polling request.
+
+        Waits start at 200ms and grow exponentially, capped at retry_delay. Polling stops once
+        max_retries * retry_delay seconds have been waited in total, the same budget as
+        max_retries polls spaced retry_delay apart, but never before max_retries polls.
+
+        Yields:
+            float: Seconds to sleep before the next poll.
+        """
+        budget = self.max_retries * self.retry_delay
+        attempt = 0
+        while attempt < self.max_retries or budget > 0:
+            delay = min(self.retry_delay, 0.2 * (1.5**attempt))
+            budget -= delay
+            attempt += 1
+            yield delay
+
+    def _parse_search_poll(self, content: bytes) -> tuple[dict | None, str | None]:
+        """
+        Read a unified search response, materializing it only once the search is complete.
+
+        When pysimdjson is installed the search context is read lazily, so incomplete poll
+        responses never get converted to Python objects. Complete responses are decoded
+        with orjson.
+
+        Args:
+            content (bytes): Raw response body.
+
+        Returns:
+            tuple[dict | None, str | None]: The full response and None if the search is
+                complete, otherwise None and the session id to poll.
+        """
+        if simdjson is None:
+            data = orjson.loads(content)
+            ctx = data["context"]
+            if ctx["status"] == "complete":
+                return data, None
+            return None, ctx["sessionId"]
+
+        parser = getattr(self._json_parsers, "parser", None)
+        if parser is None:
+            parser = self._json_parsers.parser = simdjson.Parser()
+
+        ctx = parser.parse(content)["context"]
+        status = ctx["status"]
+        session_id = None if status == "complete" else ctx["sessionId"]
+        # release the lazy proxies so the parser can be reused by the next poll
+        del ctx
+
+        if status == "complete":
+            return orjson.loads(content), None
+        return None, session_id
+
+    def _read_flight_search(
         self,
+        req,
+        json_data: dict,
         origin: Airport,
         destination: Airport | SpecialTypes,
-        depart_date: datetime.datetime | SpecialTypes | None = None,
-        return_date: datetime.datetime | SpecialTypes | None = None,
-        cabinClass: CabinClass = CabinClass.ECONOMY,
-        adults: int = 1,
-        childAges: list[int] = [],
-    ) -> SkyscannerResponse:
+        polling: bool = False,
+    ) -> tuple[SkyscannerResponse | None, str | None]:
         """
-        Search for flight prices between two points.
+        Check a unified search response, shared by the sync and async clients.
 
         Args:
-            origin (Airport): Origin airport object.
-            destination (Airport | SpecialTypes): Destination airport or special search type.
-            depart_date (datetime | SpecialTypes | None): Departure date or special enum (default: now).
-            return_date (datetime | SpecialTypes | None): Return date or special enum (optional).
-            cabinClass (CabinClass): Cabin class for travel (default: ECONOMY).
-            adults (int): Number of adult passengers (max 8).
-            childAges (list[int]): List of child ages (each 0–17, max 8 children).
+            req: Response of the search request or of a polling request.
+            json_data (dict): Payload the search was created with.
+            origin (Airport): Origin airport of the search.
+            destination (Airport | SpecialTypes): Destination of the search.
+            polling (bool): Whether req answers a polling request, which must return 200.
 
         Returns:
-            SkyscannerResponse: Parsed response containing pricing and itinerary data.
+            tuple[SkyscannerResponse | None, str | None]: The response and None once the search
+                is complete, otherwise None and the session id to poll.
 
         Raises:
-            ValueError: For invalid date logic or passenger counts.
             BannedWithCaptcha: If Skyscanner returns a CAPTCHA ban (403).
-            AttemptsExhaustedIncompleteResponse: If polling exceeds retries without completion.
+            GenericError: For non-200 polling responses.
+        """
+        if req.status_code == 403:
+            self._handle_captcha_403(req)
+
+        if polling and req.status_code != 200:
+            raise GenericError(
+                f"Error while scraping flight, status_code: {req.status_code} response: {req.text}"
+            )
+
+        data, session_id = self._parse_search_poll(req.content)
+        if data is None:
+            return None, session_id
+
+        return (
+            SkyscannerResponse(
+                data,
+                session_id=self._get_session_id(data),
+                search_payload=json_data,
+                origin=origin,
+                destination=destination,
+            ),
+            None,
+        )
+
+    def _start_car_rental_poll(self) -> dict:
+        """
+        Create the polling state consumed by _read_car_rental.
+
+        Returns:
+            dict: Remaining poll waits, last groups_count seen, and how long it has been stable.
+        """
+        return {
+            "delays": self._poll_delays(),
+            "reqn": 0,
+            "last_count": None,
+            "stable_for": 0,
+            "delay": 0,
+        }
+
+    def _read_car_rental(
+        self, req, params: dict, poll: dict
+    ) -> tuple[dict | None, float | None]:
+        """
+        Check a car rental quotes response, shared by the sync and async clients.
+
+        Results are final once groups_count hasn't changed for retry_delay seconds. Otherwise
+        params is updated for the next request.
+
+        Args:
+            req: Response of the last car rental request.
+            params (dict): Query parameters, reqn is advanced for the next request.
+            poll (dict): Polling state from _start_car_rental_poll.
+
+        Returns:
+            tuple[dict | None, float | None]: The final response and None, otherwise None and
+                the seconds to wait before the next request, or (None, None) once the polling
+                budget is spent.
+
+        Raises:
+            BannedWithCaptcha: If Skyscanner returns a CAPTCHA ban (403).
+        """
+        if req.status_code == 403:
+            self._handle_captcha_403(req)
+
+        req_data = orjson.loads(req.content)
+
+        count = req_data["groups_count"]
+        if poll["last_count"] and count == poll["last_count"]:
+            poll["stable_for"] += poll["delay"]
+            if poll["stable_for"] >= self.retry_delay:
+                return req_data, None
+        else:
+            poll["last_count"] = count
+            poll["stable_for"] = 0
+
+        poll["delay"] = next(poll["delays"], None)
+        poll["reqn"] += 1
+        params["reqn"] = str(poll["reqn"])
+        return None, poll["delay"]
+
+    def _build_flight_search(
+        self,
+        origin: Airport,
+        destination: Airport | SpecialTypes,
+        depart_date: datetime.date | datetime.datetime | SpecialTypes | None,
+        return_date: datetime.date | datetime.datetime | SpecialTypes | None,
+        cabinClass: CabinClass,
+        adults: int,
+        childAges: list[int] | None,
+    ) -> dict:
+        """
+        Validate flight search arguments and build the unified search payload.
+
+        Args:
+            See get_flight_prices.
+
+        Returns:
+            dict: Payload for the unified search endpoint.
+
+        Raises:
+            ValueError: For invalid date logic or passenger counts.
         """
+        # only the day is sent to the API, work on plain dates from here on
+        today = datetime.date.today()
         if not depart_date:
-            depart_date = datetime.datetime.now()
+            depart_date = today
+        elif isinstance(depart_date, datetime.datetime):
+            depart_date = depart_date.date()
+        if isinstance(return_date, datetime.datetime):
+            return_date = return_date.date()
+
+        childAges = childAges or ()
 
         if not all(e >= 0 and e < 18 for e in childAges):
             raise ValueError("Child ages must be >= 0 and < 18")
 
-        if isinstance(depart_date, datetime.datetime) and isinstance(
-            return_date, datetime.datetime
+        if isinstance(depart_date, datetime.date) and isinstance(
+            return_date, datetime.date
         ):
             if return_date < depart_date:
                 raise ValueError("Return date cannot be past departure")
@@ -146,123 +366,55 @@ class SkyScanner:
         if not (adults <= 8 and len(childAges) <= 8):
             raise ValueError("Max 8 adults and 8 children")
 
-        if {depart_date, return_date, destination} & {
-            SpecialTypes.ANYTIME,
-            SpecialTypes.EVERYWHERE,
-        } and cabinClass != CabinClass.ECONOMY:
+        if cabinClass != CabinClass.ECONOMY and (
+            depart_date in _SPECIAL
+            or return_date in _SPECIAL
+            or destination in _SPECIAL
+        ):
             raise ValueError(
                 "To search for cabin class that's not economy enter depart_date / return_date and destination"
             )
 
-        now = datetime.datetime.now()
-        if depart_date < now or (return_date and (return_date < now)):
+        if (isinstance(depart_date, datetime.date) and depart_date < today) or (
+            isinstance(return_date, datetime.date) and return_date < today
+        ):
             raise ValueError("Depart date or return date cannot be in the past")
 
         json_data = {
             "adults": adults,
-            "childAges": childAges,
+            "childAges": list(childAges),
             "cabinClass": cabinClass.value,
             "legs": [
-                self.__gen_leg(depart_date, origin=origin, destination=destination),
+                self._gen_leg(depart_date, origin=origin, destination=destination),
             ],
             "options": None,
         }
 
         if return_date:
-            return_leg = self.__gen_leg(
+            return_leg = self._gen_leg(
                 return_date, origin=destination, destination=origin
             )
             json_data["legs"].append(return_leg)
 
-        custom_headers = {
-            "X-Skyscanner-Viewid": str(uuid.uuid4()),
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept-Encoding": "gzip, deflate, br",
-        }
-        
-        req = self.session.post(
-            config.UNIFIED_SEARCH_ENDPOINT, json=json_data, headers=custom_headers
-        )
-        
-        if req.status_code == 403:
-            self._handle_captcha_403(req)
-            
-        data = orjson.loads(req.content)
-
-        if data["context"]["status"] == "complete":
-            return SkyscannerResponse(
-                data,
-                session_id=self.__get_session_id(data),
-                search_payload=json_data,
-                origin=origin,
-                destination=destination,
-            )
-
-        retries = 0
-        session_id = data["context"]["sessionId"]
-
-        while retries < self.max_retries:
-            time.sleep(self.retry_delay)
-            url = config.UNIFIED_SEARCH_ENDPOINT + session_id
-            req = self.session.get(url, headers=custom_headers)
-            data = orjson.loads(req.content)
-
-            if req.status_code != 200:
-                raise GenericError(
-                    f"Error while scraping flight, status_code: {req.status_code} response: {req.text}"
-                )
-
-            if data["context"]["status"] == "complete":
-                return SkyscannerResponse(
-                    data,
-                    session_id=self.__get_session_id(data),
-                    search_payload=json_data,
-                    origin=origin,
-                    destination=destination,
-                )
-            session_id = data["context"]["sessionId"]
-            retries += 1
-
-        raise AttemptsExhaustedIncompleteResponse()
-
-    @typechecked
-    def search_airports(
-        self, query: str, depart_date=None, return_date=None
-    ) -> list[Airport]:
-        """
-        Auto-suggest airports based on a query string.
-
-        Args:
-            query (str): Text to search for airport names or codes.
-            depart_date (datetime | None): Optional outbound date for context.
-            return_date (datetime | None): Optional inbound date for context.
+        return json_data
 
-        Returns:
-            list[Airport]: List of suggested Airport objects.
+    def _airport_search_params(self, query: str, depart_date, return_date) -> dict:
+        return {
+            "query": query,
+            "inboundDate": depart_date.strftime("%Y-%m-%d") if depart_date else "",
+            "outboundDate": return_date.strftime("%Y-%m-%d") if return_date else "",
+        }
 
-        Raises:
-            BannedWithCaptcha: If API responds with a CAPTCHA ban (403).
-            GenericError: For non-200 status codes.
-        """
-        req = self.session.get(
-            config.SEARCH_ORIGIN_ENDPOINT,
-            params={
-                "query": query,
-                "inboundDate": depart_date.strftime("%Y-%m-%d") if depart_date else "",
-                "outboundDate": return_date.strftime("%Y-%m-%d") if return_date else "",
-            },
-        )
+    def _parse_airports(self, req) -> list[Airport]:
         if req.status_code == 403:
-            raise BannedWithCaptcha(
-                "https://www.skyscanner.net" + req.json()["redirect_to"]
-            )
+            self._handle_captcha_403(req)
 
         if req.status_code != 200:
             raise GenericError(
                 f"Error when scraping airports, code: {req.status_code} text: {req.text}"
             )
 
-        data = req.json()
+        data = orjson.loads(req.content)
         return [
             Airport(
                 title=e["presentation"]["title"],
@@ -272,99 +424,66 @@ class SkyScanner:
             for e in data["inputSuggest"]
         ]
 
-    @typechecked
-    def search_locations(self, query: str) -> list[Location]:
-        """
-        Auto-suggest locations based on a query.
-
-        Args:
-            query (str): Text to search for locations.
-
-        Returns:
-            list[Location]: List of suggested Location objects.
-
-        Raises:
-            BannedWithCaptcha: If API responds with a CAPTCHA ban (403).
-            GenericError: For non-200 status codes.
-        """
-        url = (
+    def _location_search_url(self, query: str) -> str:
+        return (
             config.LOCATION_SEARCH_ENDPOINT.format(
                 locale=self.locale, market=self.market
             )
             + query
         )
-        params = {"autosuggestExp": "neighborhood_b"}
 
-        req = self.session.get(url, params=params)
+    def _parse_locations(self, req) -> list[Location]:
         if req.status_code == 403:
-            raise BannedWithCaptcha(
-                "https://www.skyscanner.net" + req.json()["redirect_to"]
-            )
+            self._handle_captcha_403(req)
 
         if req.status_code != 200:
             raise GenericError(
                 f"Error when scraping airports, code: {req.status_code} text: {req.text}"
             )
 
+        data = orjson.loads(req.content)
         return [
             Location(
                 location["entity_name"], location["entity_id"], location["location"]
             )
-            for location in req.json()
+            for location in data
         ]
 
-    @typechecked
-    def get_airport_by_code(self, airport_code: str) -> Airport:
-        """
-        Retrieve a single Airport by its IATA code.
-
-        Args:
-            airport_code (str): Three-letter IATA code to look up.
-
-        Returns:
-            Airport: Matching Airport object.
-
-        Raises:
-            GenericError: If no airport matches the given code.
-        """
-        airports = self.search_airports(airport_code)
+    def _cache_airports(self, airports: list[Airport]):
         for airport in airports:
-            if airport.skyId == airport_code:
-                return airport
-        raise GenericError(f"IATA code not found: {airport_code}")
+            self._airport_cache.setdefault(airport.skyId.upper(), airport)
+
+    def _uncached_airport_codes(self, airport_codes: list[str]) -> list[str]:
+        return list(
+            dict.fromkeys(
+                code.upper()
+                for code in airport_codes
+                if code.upper() not in self._airport_cache
+            )
+        )
 
-    @typechecked
-    def get_itinerary_details(
+    def _get_cached_airport(self, airport_code: str) -> Airport:
+        airport = self._airport_cache.get(airport_code.upper())
+        if not airport:
+            raise GenericError(f"IATA code not found: {airport_code}")
+        return airport
+
+    def _build_itinerary_request(
         self, itineraryId: str, response: SkyscannerResponse
-    ) -> dict:
+    ) -> tuple[dict, dict]:
         """
-        Retrieve detailed information for a specific flight itinerary.
-
-        This method fetches extended itinerary data for a previously obtained search session and itinerary ID.
-
-        Warning: itineraryId must be obtained from the SkyscannerResponse given
+        Build the payload and headers for an itinerary details request.
 
         Args:
-            itineraryId (str): Unique identifier for the itinerary, obtained from SkyscannerResponse.
-            response (SkyscannerResponse): The response object from a flight search containing session_id,
-                search_payload, origin, and destination details.
+            See get_itinerary_details.
 
         Returns:
-            dict: Parsed JSON response with itinerary details including flight legs,
-                user preferences, and search request parameters.
-
-        Raises:
-            BannedWithCaptcha: If Skyscanner returns a CAPTCHA ban (HTTP 403).
-            GenericError: For non-200 HTTP responses indicating a failed request.
-
-        Example:
-            >>> details = scanner.get_itinerary_details(itinerary_id, search_response)
-            >>> flight_legs = details.get('itineraryLegs')
+            tuple[dict, dict]: JSON payload and request headers.
         """
         json_data = {
             "itineraryId": itineraryId,
             "searchSessionId": response.session_id,
-            "featuresEnabled": ["FEATURES_ENABLED_ITINERARY_LEGACY_INFO"],
+            "featuresEnabled": _ITIN_FEATURES,
             "userPreferences": {
                 "market": self.market,
                 "currencyCode": self.currency,
@@ -375,32 +494,21 @@ class SkyScanner:
                 "cabinClass": response.search_payload["cabinClass"],
                 "legs": [],
             },
-            "options": {
-                "totalCostOptions": {
-                    "fareAttributeFilters": [
-                        "ATTRIBUTE_CABIN_BAGGAGE",
-                        "ATTRIBUTE_CHECKED_BAGGAGE",
-                    ]
-                }
-            },
+            "options": _ITIN_OPTIONS,
         }
         if response.search_payload["childAges"]:
             json_data["searchRequestDetails"]["childAges"] = response.search_payload[
                 "childAges"
             ]
+        id_to_sky = {
+            response.origin.entity_id: response.origin.skyId,
+            response.destination.entity_id: response.destination.skyId,
+        }
         for leg in response.search_payload["legs"]:
             originId = leg.get("legOrigin", leg)["entityId"]
             destinationId = leg.get("legDestination", leg)["entityId"]
-            originIata = (
-                response.origin.skyId  # suf
-                if response.origin.entity_id == originId
-                else response.destination.skyId
-            )
-            destinationIata = (
-                response.destination.skyId
-                if response.destination.entity_id == destinationId
-                else response.origin.skyId
-            )
+            originIata = id_to_sky.get(originId, response.destination.skyId)
+            destinationIata = id_to_sky.get(destinationId, response.origin.skyId)
             date = leg["dates"]
             res = {
                 "originIata": originIata,
@@ -419,25 +527,15 @@ class SkyScanner:
             }
             json_data["searchRequestDetails"]["legs"].append(res)
         headers = {
-            "grpc-metadata-x-skyscanner-devicedetection-istablet": "false",  # required
-            "grpc-metadata-x-skyscanner-devicedetection-ismobile": "true",  # required
-            "grpc-metadata-x-skyscanner-channelid": "goandroid",
+            **self._itinerary_headers_base,
             "grpc-metadata-x-skyscanner-viewid": str(uuid.uuid4()),
-            "grpc-metadata-x-skyscanner-clientid": "skyscanner_app",
-            "grpc-metadata-x-skyscanner-client-type": "net.skyscanner.android.main",
             "grpc-metadata-skyscanner-flights-config-session-id": str(uuid.uuid4()),
-            "grpc-metadata-x-skyscanner-consent-information": "true",
-            "grpc-metadata-x-skyscanner-consent-adverts": "true",
-            "content-type": "application/json; charset=utf-8",
-            "accept-encoding": "gzip",
         }
-        req = self.session.post(
-            config.ITINERARY_DETAILS_ENDPOINT, json=json_data, headers=headers
-        )
+        return json_data, headers
+
+    def _parse_itinerary_details(self, req) -> dict:
         if req.status_code == 403:
-            raise BannedWithCaptcha(
-                "https://www.skyscanner.net" + req.json()["redirect_to"]
-            )
+            self._handle_captcha_403(req)
         if req.status_code != 200:
             raise GenericError(
                 f"Error fetching itinerary details, code: {req.status_code}, text: {req.text}"
@@ -445,28 +543,19 @@ class SkyScanner:
 
         return orjson.loads(req.content)
 
-    @typechecked
-    def get_car_rental_from_url(self, url: str):
+    def _parse_car_rental_url(self, url: str) -> dict:
         """
-        Parses a car rental booking URL and returns car rental options based on the extracted parameters.
-
-        The method extracts information such as driver's age, origin and destination location IDs,
-        departure and return times from a structured Skyscanner-style URL. It then uses these parameters
-        to fetch car rental data via `self.get_car_rental`.
-
-        Example URL:
-            https://www.skyscanner.net/g/carhire-quotes/GB/en-GB/GBP/30/27544008/27544008/2025-07-01T10:00/2025-08-01T10:00/?group=true...
+        Extract get_car_rental keyword arguments from a Skyscanner car hire URL.
 
-        Parameters:
-            url (str): A Skyscanner car hire URL containing rental booking information.
+        Args:
+            url (str): A Skyscanner car hire URL, see get_car_rental_from_url.
 
         Returns:
-            Any: The result of the `get_car_rental` method, which provides car rental options.
+            dict: Keyword arguments for get_car_rental.
 
         Raises:
             ValueError: If the date format is invalid or required segments are missing from the URL.
         """
-
         url = url.split("?")[0]
 
         args = url.split("/")
@@ -482,39 +571,33 @@ class SkyScanner:
         depart_time = datetime.datetime.fromisoformat(args[11])
         return_time = datetime.datetime.fromisoformat(args[12])
 
-        return self.get_car_rental(
-            origin=origin,
-            depart_time=depart_time,
-            return_time=return_time,
-            is_driver_over_25=is_driver_over_25,
-            destination=destination,
-        )
+        return {
+            "origin": origin,
+            "depart_time": depart_time,
+            "return_time": return_time,
+            "is_driver_over_25": is_driver_over_25,
+            "destination": destination,
+        }
 
-    @typechecked
-    def get_car_rental(
+    def _build_car_rental_request(
         self,
         origin: Location | Coordinates | Airport,
         depart_time: datetime.datetime,
         return_time: datetime.datetime,
-        destination: Location | Coordinates | Airport | None = None,
-        is_driver_over_25: bool = True,
-    ) -> dict:
+        destination: Location | Coordinates | Airport | None,
+        is_driver_over_25: bool,
+    ) -> tuple[str, dict]:
         """
-        Search for car rental options between two locations and times.
+        Validate car rental arguments and build the quotes URL and query parameters.
 
         Args:
-            origin (Location | Coordinates | Airport): Pickup location.
-            depart_time (datetime): Pickup datetime.
-            return_time (datetime): Drop-off datetime.
-            destination (Location | Coordinates | Airport | None): Drop-off location (defaults to origin).
-            is_driver_over_25 (bool): Flag for driver age pricing threshold
+            See get_car_rental.
 
         Returns:
-            dict: JSON response containing car rental group listings and metadata.
+            tuple[str, dict]: Car rental endpoint URL and query parameters.
 
         Raises:
             ValueError: If dates are invalid or in the past.
-            AttemptsExhaustedIncompleteResponse: If polling retries exhaust without stable response.
         """
         if not destination:
             destination = origin
@@ -559,34 +642,14 @@ class SkyScanner:
             "channel": "android",
             "vndr_img_rounded": "true",
             "ranking_enable": "false",
-            "reqn": "0",
+            "reqn": "0",  # request counter, set on every poll
             "version": "6.9",
             "include_location": "true",
             "city_search_enable": "true",
         }
+        return url, params
 
-        last_count = None
-
-        for _ in range(self.max_retries):
-            req = self.session.get(url, params=params)
-            req_data = req.json()
-            params["reqn"] = str(int(params["reqn"]) + 1)
-
-            count = req_data["groups_count"]
-            if not last_count:
-                last_count = count
-                time.sleep(self.retry_delay)
-                continue
-
-            if count == last_count:
-                return req_data
-
-            last_count = count
-            time.sleep(self.retry_delay)
-
-        raise AttemptsExhaustedIncompleteResponse()
-
-    def __get_session_id(self, data: dict) -> str | None:
+    def _get_session_id(self, data: dict) -> str | None:
         """
         Extract the search session ID from a Skyscanner API response.
 
@@ -600,10 +663,10 @@ class SkyScanner:
             return None
         return data["itineraries"]["context"]["sessionId"]
 
-    def __gen_leg(
+    def _gen_leg(
         self,
-        depart_date: datetime.datetime | SpecialTypes | None = None,
-        return_date: datetime.datetime | SpecialTypes | None = None,
+        depart_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
+        return_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
         origin: Airport | SpecialTypes | None = None,
         destination: Airport | SpecialTypes | None = None,
     ) -> dict:
@@ -611,8 +674,8 @@ class SkyScanner:
         Construct a search leg dictionary for Skyscanner API requests.
 
         Args:
-            depart_date (datetime | SpecialTypes | None): Outbound date or enum.
-            return_date (datetime | SpecialTypes | None): Inbound date or enum.
+            depart_date (date | SpecialTypes | None): Outbound date or enum.
+            return_date (date | SpecialTypes | None): Inbound date or enum.
             origin (Airport | SpecialTypes | None): Origin airport or special enum.
             destination (Airport | SpecialTypes | None): Destination airport or special enum.
 
@@ -623,7 +686,7 @@ class SkyScanner:
         date = depart_date if depart_date else return_date
         res["dates"] = (
             {"@type": "date", "year": date.year, "month": date.month, "day": date.day}
-            if isinstance(date, datetime.datetime)
+            if isinstance(date, datetime.date)
             else {"@type": date}
         )
         res["legOrigin"] = (
@@ -642,3 +705,438 @@ class SkyScanner:
             else origin.entity_id
         )
         return res
+
+
+# TODO aggiungere scraping da qualsiasi (tipo Milano)
+class SkyScanner(_BaseSkyScanner):
+    """
+    A client for interacting with the Skyscanner flight and car rental APIs.
+
+    This class handles search session creation, flight price lookups, airport and location
+    autosuggestions, itinerary detail retrieval, and car rental listings, with built-in retry
+    and error handling.
+    """
+
+    @typechecked
+    def get_flight_prices(
+        self,
+        origin: Airport,
+        destination: Airport | SpecialTypes,
+        depart_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
+        return_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
+        cabinClass: CabinClass = CabinClass.ECONOMY,
+        adults: int = 1,
+        childAges: list[int] | None = None,
+    ) -> SkyscannerResponse:
+        """
+        Search for flight prices between two points.
+
+        Args:
+            origin (Airport): Origin airport object.
+            destination (Airport | SpecialTypes): Destination airport or special search type.
+            depart_date (date | datetime | SpecialTypes | None): Departure date or special enum (default: today).
+                Only the year, month and day are used.
+            return_date (date | datetime | SpecialTypes | None): Return date or special enum (optional).
+            cabinClass (CabinClass): Cabin class for travel (default: ECONOMY).
+            adults (int): Number of adult passengers (max 8).
+            childAges (list[int] | None): List of child ages (each 0–17, max 8 children).
+
+        Returns:
+            SkyscannerResponse: Parsed response containing pricing and itinerary data.
+
+        Raises:
+            ValueError: For invalid date logic or passenger counts.
+            BannedWithCaptcha: If Skyscanner returns a CAPTCHA ban (403).
+            AttemptsExhaustedIncompleteResponse: If polling exceeds retries without completion.
+        """
+        json_data = self._build_flight_search(
+            origin, destination, depart_date, return_date, cabinClass, adults, childAges
+        )
+
+        custom_headers = {
+            **self._flight_headers_base,
+            "X-Skyscanner-Viewid": str(uuid.uuid4()),
+        }
+
+        req = self.session.post(
+            config.UNIFIED_SEARCH_ENDPOINT, data=orjson.dumps(json_data), headers=custom_headers
+        )
+        result, session_id = self._read_flight_search(req, json_data, origin, destination)
+        if result:
+            return result
+
+        for delay in self._poll_delays():
+            time.sleep(delay)
+            url = config.UNIFIED_SEARCH_ENDPOINT + session_id
+            req = self.session.get(url, headers=custom_headers)
+            result, session_id = self._read_flight_search(
+                req, json_data, origin, destination, polling=True
+            )
+            if result:
+                return result
+
+        raise AttemptsExhaustedIncompleteResponse()
+
+    @typechecked
+    def search_airports(
+        self, query: str, depart_date=None, return_date=None
+    ) -> list[Airport]:
+        """
+        Auto-suggest airports based on a query string.
+
+        Args:
+            query (str): Text to search for airport names or codes.
+            depart_date (datetime | None): Optional outbound date for context.
+            return_date (datetime | None): Optional inbound date for context.
+
+        Returns:
+            list[Airport]: List of suggested Airport objects.
+
+        Raises:
+            BannedWithCaptcha: If API responds with a CAPTCHA ban (403).
+            GenericError: For non-200 status codes.
+        """
+        req = self.session.get(
+            config.SEARCH_ORIGIN_ENDPOINT,
+            params=self._airport_search_params(query, depart_date, return_date),
+        )
+        return self._parse_airports(req)
+
+    @typechecked
+    def search_locations(self, query: str) -> list[Location]:
+        """
+        Auto-suggest locations based on a query.
+
+        Args:
+            query (str): Text to search for locations.
+
+        Returns:
+            list[Location]: List of suggested Location objects.
+
+        Raises:
+            BannedWithCaptcha: If API responds with a CAPTCHA ban (403).
+            GenericError: For non-200 status codes.
+        """
+        params = {"autosuggestExp": "neighborhood_b"}
+
+        req = self.session.get(self._location_search_url(query), params=params)
+        return self._parse_locations(req)
+
+    @typechecked
+    def get_airport_by_code(self, airport_code: str) -> Airport:
+        """
+        Retrieve a single Airport by its IATA code.
+
+        Lookups are cached per client, and every airport returned by the
+        autosuggest call is cached too, so nearby codes are usually free.
+
+        Args:
+            airport_code (str): Three-letter IATA code to look up.
+
+        Returns:
+            Airport: Matching Airport object.
+
+        Raises:
+            GenericError: If no airport matches the given code.
+        """
+        if airport_code.upper() not in self._airport_cache:
+            self._cache_airports(self.search_airports(airport_code))
+        return self._get_cached_airport(airport_code)
+
+    @typechecked
+    def get_airports_by_codes(self, airport_codes: list[str]) -> dict[str, Airport]:
+        """
+        Retrieve several Airports by their IATA codes.
+
+        Codes that aren't cached yet are looked up concurrently on a thread pool.
+
+        Args:
+            airport_codes (list[str]): IATA codes to look up.
+
+        Returns:
+            dict[str, Airport]: Matching Airport objects keyed by the given codes.
+
+        Raises:
+            GenericError: If any code has no matching airport.
+        """
+        missing = self._uncached_airport_codes(airport_codes)
+        if missing:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(missing))
+            ) as executor:
+                list(executor.map(self.get_airport_by_code, missing))
+        return {code: self._get_cached_airport(code) for code in airport_codes}
+
+    @typechecked
+    def get_itinerary_details(
+        self, itineraryId: str, response: SkyscannerResponse
+    ) -> dict:
+        """
+        Retrieve detailed information for a specific flight itinerary.
+
+        This method fetches extended itinerary data for a previously obtained search session and itinerary ID.
+
+        Warning: itineraryId must be obtained from the SkyscannerResponse given
+
+        Args:
+            itineraryId (str): Unique identifier for the itinerary, obtained from SkyscannerResponse.
+            response (SkyscannerResponse): The response object from a flight search containing session_id,
+                search_payload, origin, and destination details.
+
+        Returns:
+            dict: Parsed JSON response with itinerary details including flight legs,
+                user preferences, and search request parameters.
+
+        Raises:
+            BannedWithCaptcha: If Skyscanner returns a CAPTCHA ban (HTTP 403).
+            GenericError: For non-200 HTTP responses indicating a failed request.
+
+        Example:
+            >>> details = scanner.get_itinerary_details(itinerary_id, search_response)
+            >>> flight_legs = details.get('itineraryLegs')
+        """
+        json_data, headers = self._build_itinerary_request(itineraryId, response)
+        req = self.session.post(
+            config.ITINERARY_DETAILS_ENDPOINT, data=orjson.dumps(json_data), headers=headers
+        )
+        return self._parse_itinerary_details(req)
+
+    @typechecked
+    def get_car_rental_from_url(self, url: str):
+        """
+        Parses a car rental booking URL and returns car rental options based on the extracted parameters.
+
+        The method extracts information such as driver's age, origin and destination location IDs,
+        departure and return times from a structured Skyscanner-style URL. It then uses these parameters
+        to fetch car rental data via `self.get_car_rental`.
+
+        Example URL:
+            https://www.skyscanner.net/g/carhire-quotes/GB/en-GB/GBP/30/27544008/27544008/2025-07-01T10:00/2025-08-01T10:00/?group=true...
+
+        Parameters:
+            url (str): A Skyscanner car hire URL containing rental booking information.
+
+        Returns:
+            Any: The result of the `get_car_rental` method, which provides car rental options.
+
+        Raises:
+            ValueError: If the date format is invalid or required segments are missing from the URL.
+        """
+        return self.get_car_rental(**self._parse_car_rental_url(url))
+
+    @typechecked
+    def get_car_rental(
+        self,
+        origin: Location | Coordinates | Airport,
+        depart_time: datetime.datetime,
+        return_time: datetime.datetime,
+        destination: Location | Coordinates | Airport | None = None,
+        is_driver_over_25: bool = True,
+    ) -> dict:
+        """
+        Search for car rental options between two locations and times.
+
+        Args:
+            origin (Location | Coordinates | Airport): Pickup location.
+            depart_time (datetime): Pickup datetime.
+            return_time (datetime): Drop-off datetime.
+            destination (Location | Coordinates | Airport | None): Drop-off location (defaults to origin).
+            is_driver_over_25 (bool): Flag for driver age pricing threshold
+
+        Returns:
+            dict: JSON response containing car rental group listings and metadata.
+
+        Raises:
+            ValueError: If dates are invalid or in the past.
+            AttemptsExhaustedIncompleteResponse: If polling retries exhaust without stable response.
+        """
+        url, params = self._build_car_rental_request(
+            origin, depart_time, return_time, destination, is_driver_over_25
+        )
+
+        poll = self._start_car_rental_poll()
+
+        while True:
+            req = self.session.get(url, params=params)
+            req_data, delay = self._read_car_rental(req, params, poll)
+            if req_data is not None:
+                return req_data
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        raise AttemptsExhaustedIncompleteResponse()
+
+
+class AsyncSkyScanner(_BaseSkyScanner):
+    """
+    Asyncio version of SkyScanner built on curl_cffi.AsyncSession.
+
+    Exposes the same methods as SkyScanner as coroutines, so independent lookups
+    (airports, itinerary details...) can run concurrently with asyncio.gather.
+    The constructor takes the same arguments and still solves PX synchronously.
+    """
+
+    _session_class = curl_cffi.AsyncSession
+
+    @typechecked
+    async def get_flight_prices(
+        self,
+        origin: Airport,
+        destination: Airport | SpecialTypes,
+        depart_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
+        return_date: datetime.date | datetime.datetime | SpecialTypes | None = None,
+        cabinClass: CabinClass = CabinClass.ECONOMY,
+        adults: int = 1,
+        childAges: list[int] | None = None,
+    ) -> SkyscannerResponse:
+        """
+        Search for flight prices between two points.
+
+        See SkyScanner.get_flight_prices for arguments, return value and raised errors.
+        """
+        json_data = self._build_flight_search(
+            origin, destination, depart_date, return_date, cabinClass, adults, childAges
+        )
+
+        custom_headers = {
+            **self._flight_headers_base,
+            "X-Skyscanner-Viewid": str(uuid.uuid4()),
+        }
+
+        req = await self.session.post(
+            config.UNIFIED_SEARCH_ENDPOINT, data=orjson.dumps(json_data), headers=custom_headers
+        )
+        result, session_id = self._read_flight_search(req, json_data, origin, destination)
+        if result:
+            return result
+
+        for delay in self._poll_delays():
+            await asyncio.sleep(delay)
+            url = config.UNIFIED_SEARCH_ENDPOINT + session_id
+            req = await self.session.get(url, headers=custom_headers)
+            result, session_id = self._read_flight_search(
+                req, json_data, origin, destination, polling=True
+            )
+            if result:
+                return result
+
+        raise AttemptsExhaustedIncompleteResponse()
+
+    @typechecked
+    async def search_airports(
+        self, query: str, depart_date=None, return_date=None
+    ) -> list[Airport]:
+        """
+        Auto-suggest airports based on a query string.
+
+        See SkyScanner.search_airports for arguments, return value and raised errors.
+        """
+        req = await self.session.get(
+            config.SEARCH_ORIGIN_ENDPOINT,
+            params=self._airport_search_params(query, depart_date, return_date),
+        )
+        return self._parse_airports(req)
+
+    @typechecked
+    async def search_locations(self, query: str) -> list[Location]:
+        """
+        Auto-suggest locations based on a query.
+
+        See SkyScanner.search_locations for arguments, return value and raised errors.
+        """
+        params = {"autosuggestExp": "neighborhood_b"}
+
+        req = await self.session.get(self._location_search_url(query), params=params)
+        return self._parse_locations(req)
+
+    @typechecked
+    async def get_airport_by_code(self, airport_code: str) -> Airport:
+        """
+        Retrieve a single Airport by its IATA code.
+
+        See SkyScanner.get_airport_by_code for arguments, return value and raised errors.
+        """
+        if airport_code.upper() not in self._airport_cache:
+            self._cache_airports(await self.search_airports(airport_code))
+        return self._get_cached_airport(airport_code)
+
+    @typechecked
+    async def get_airports_by_codes(
+        self, airport_codes: list[str]
+    ) -> dict[str, Airport]:
+        """
+        Retrieve several Airports by their IATA codes, looking up uncached codes concurrently.
+
+        See SkyScanner.get_airports_by_codes for arguments, return value and raised errors.
+        """
+        missing = self._uncached_airport_codes(airport_codes)
+        await asyncio.gather(*(self.get_airport_by_code(code) for code in missing))
+        return {code: self._get_cached_airport(code) for code in airport_codes}
+
+    @typechecked
+    async def get_itinerary_details(
+        self, itineraryId: str, response: SkyscannerResponse
+    ) -> dict:
+        """
+        Retrieve detailed information for a specific flight itinerary.
+
+        See SkyScanner.get_itinerary_details for arguments, return value and raised errors.
+        """
+        json_data, headers = self._build_itinerary_request(itineraryId, response)
+        req = await self.session.post(
+            config.ITINERARY_DETAILS_ENDPOINT, data=orjson.dumps(json_data), headers=headers
+        )
+        return self._parse_itinerary_details(req)
+
+    @typechecked
+    async def get_car_rental_from_url(self, url: str):
+        """
+        Parses a car rental booking URL and returns car rental options based on the extracted parameters.
+
+        See SkyScanner.get_car_rental_from_url for arguments, return value and raised errors.
+        """
+        return await self.get_car_rental(**self._parse_car_rental_url(url))
+
+    @typechecked
+    async def get_car_rental(
+        self,
+        origin: Location | Coordinates | Airport,
+        depart_time: datetime.datetime,
+        return_time: datetime.datetime,
+        destination: Location | Coordinates | Airport | None = None,
+        is_driver_over_25: bool = True,
+    ) -> dict:
+        """
+        Search for car rental options between two locations and times.
+
+        See SkyScanner.get_car_rental for arguments, return value and raised errors.
+        """
+        url, params = self._build_car_rental_request(
+            origin, depart_time, return_time, destination, is_driver_over_25
+        )
+
+        poll = self._start_car_rental_poll()
+
+        while True:
+            req = await self.session.get(url, params=params)
+            req_data, delay = self._read_car_rental(req, params, poll)
+            if req_data is not None:
+                return req_data
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        raise AttemptsExhaustedIncompleteResponse()
+
+    async def close(self):
+        """
+        Close the underlying async HTTP session.
+        """
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()